@@ -3,10 +3,11 @@ from __future__ import annotations
 import logging
 import math
 from abc import ABC, abstractmethod
-from itertools import pairwise
+from collections.abc import Sequence
 
 import numpy as np
 from dbetto import AttrsDict
+from numba import cuda
 from numpy.typing import ArrayLike, NDArray
 from pint import Quantity, get_application_registry
 from pyg4ometry import geant4
@@ -19,6 +20,11 @@ u = get_application_registry()
 
 log = logging.getLogger(__name__)
 
+_CUDA_THREADS_PER_BLOCK = 256
+
+# default surface tolerance of the geometrical queries, in mm
+_DEFAULT_TOL = 1e-11
+
 
 class HPGe(ABC, geant4.LogicalVolume):
     """An High-Purity Germanium detector.
@@ -35,6 +41,13 @@ class HPGe(ABC, geant4.LogicalVolume):
         pyg4ometry Geant4 registry instance.
     material
         pyg4ometry Geant4 material for the detector.
+    precision
+        floating point precision (``float64`` or ``float32``) of the cached
+        detector profile used by :meth:`is_inside` and
+        :meth:`distance_to_surface`. Single precision halves the memory
+        traffic of these queries, at the price of a ~1e-7 relative accuracy.
+        The default surface tolerance of the queries is enlarged accordingly,
+        such that points on the surface are still considered inside.
     """
 
     def __init__(
@@ -43,6 +56,7 @@ class HPGe(ABC, geant4.LogicalVolume):
         name: str | None = None,
         registry: geant4.Registry | None = None,
         material: geant4.Material | None = None,
+        precision: str = "float64",
     ) -> None:
         if metadata is None:
             msg = "metadata cannot be None"
@@ -50,6 +64,9 @@ class HPGe(ABC, geant4.LogicalVolume):
         if registry is None:
             msg = "registry cannot be None"
             raise ValueError(msg)
+        if precision not in ("float64", "float32"):
+            msg = f"precision must be 'float64' or 'float32', not {precision!r}"
+            raise ValueError(msg)
 
         if material is not None and material.registry != registry:
             msg = "material has different registry than HPGe det"
@@ -76,6 +93,32 @@ class HPGe(ABC, geant4.LogicalVolume):
         # build logical volume, default [mm]
         super().__init__(self._g4_solid(), material, self.name, self.registry)
 
+        # cache the decoded (r, z) profile and its segments, used by the
+        # geometrical queries
+        dtype = np.dtype(precision)
+        r, z = self.get_profile()
+        segments = utils.get_segment_arrays(r, z)
+
+        # a few units of the floating point precision at the detector size,
+        # which only exceeds the default in single precision
+        scale = max(np.max(np.abs(r)), np.max(np.abs(z)))
+        self._tol = max(_DEFAULT_TOL, 4 * float(np.finfo(dtype).eps) * scale)
+
+        # the profile is also kept in double precision, for the volume and
+        # surface area
+        self._profile = (
+            np.asarray(r, dtype=np.float64),
+            np.asarray(z, dtype=np.float64),
+        )
+        self._r = self._profile[0].astype(dtype, copy=False)
+        self._z = self._profile[1].astype(dtype, copy=False)
+        self._seg_s1, self._seg_d, self._seg_inv_len2 = (
+            a.astype(dtype) for a in segments
+        )
+
+        # copies on the CUDA device, created on first use
+        self._device_arrays = None
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.metadata})"
 
@@ -94,7 +137,10 @@ class HPGe(ABC, geant4.LogicalVolume):
         # return ordered r,z lists, default unit [mm]
         r, z = self._decode_polycone_coord()
 
-        # build generic polycone, default [mm]
+        # build generic polycone, default [mm]. The plain lists are passed on
+        # purpose: pyg4ometry evaluates the parameters element by element
+        # anyway, and NumPy arrays would only add scalar boxing and change
+        # the type returned by get_profile()
         return geant4.solid.GenericPolycone(
             self.name, 0, 2 * math.pi, r, z, self.registry
         )
@@ -125,21 +171,47 @@ class HPGe(ABC, geant4.LogicalVolume):
         -----
             For V02160A and P00664A the detector profile is that of the solid without cut.
         """
-        if not isinstance(self.solid, geant4.solid.GenericPolycone) and not isinstance(
-            self.solid.obj1, geant4.solid.GenericPolycone
-        ):
+        solid = self.solid
+        if not isinstance(solid, geant4.solid.GenericPolycone):
+            solid = getattr(solid, "obj1", None)
+
+        if not isinstance(solid, geant4.solid.GenericPolycone):
             msg = "solid is not a polycone and neither is its primary consistient (obj1), thus no profile can be computed."
             raise ValueError(msg)
+
+        return solid.pR, solid.pZ
+
+    def _check_polycone(self, method: str) -> None:
+        """Check that the solid is a polycone, as required by the geometrical queries."""
         if not isinstance(self.solid, geant4.solid.GenericPolycone):
-            r = self.solid.obj1.pR
-            z = self.solid.obj1.pZ
-        else:
-            r = self.solid.pR
-            z = self.solid.pZ
+            msg = f"{method} is not implemented for {type(self.solid)} yet"
+            raise NotImplementedError(msg)
 
-        return r, z
+    @staticmethod
+    def _get_coords_rz(coords: ArrayLike, dtype: np.dtype) -> NDArray:
+        """Check the input `(x,y,z)` coordinates and convert them to `(r,z)`."""
+        # contiguous array of the working precision, copied only if needed
+        coords = np.ascontiguousarray(coords, dtype=dtype)
 
-    def is_inside(self, coords: ArrayLike, tol: float = 1e-11) -> NDArray[bool]:
+        if coords.ndim != 2 or coords.shape[1] != 3:
+            msg = "coords must be provided as a 2D array with x,y,z coordinates for each point."
+            raise ValueError(msg)
+
+        return utils.convert_coords(coords)
+
+    def _get_segments(
+        self, surface_indices: ArrayLike | None = None
+    ) -> tuple[NDArray, NDArray, NDArray]:
+        """Get the cached line segments of the requested surfaces."""
+        s1, d, inv_len2 = self._seg_s1, self._seg_d, self._seg_inv_len2
+        if surface_indices is not None:
+            s1 = s1[surface_indices]
+            d = d[surface_indices]
+            inv_len2 = inv_len2[surface_indices]
+
+        return s1, d, inv_len2
+
+    def is_inside(self, coords: ArrayLike, tol: float | None = None) -> NDArray[bool]:
         """Compute whether each point is inside the volume.
 
         Parameters
@@ -150,16 +222,28 @@ class HPGe(ABC, geant4.LogicalVolume):
         tol
             distance outside the surface which is considered inside. Should be
             on the order of numerical precision of the floating point representation.
+            If ``None`` (the default), ``1e-11`` or for ``float32`` detectors a
+            few units of the floating point precision at the detector size.
+
+        Note
+        ----
+        - Only implemented for solids based on :class:`geant4.solid.GenericPolycone`
+        - Coordinates should be relative to the origin of the polycone.
         """
+        self._check_polycone("is_inside")
+        tol = self._tol if tol is None else tol
+        coords_rz = self._get_coords_rz(coords, self._r.dtype)
+
+        inside = np.empty(len(coords_rz), dtype=np.bool_)
+        utils.polyline_inside(coords_rz, self._r, self._z, tol, inside)
 
-        dists = self.distance_to_surface(coords, tol=tol, signed=True)
-        return np.where(dists >= 0, True, False)
+        return inside
 
     def distance_to_surface(
         self,
         coords: ArrayLike,
         surface_indices: ArrayLike | None = None,
-        tol: float = 1e-11,
+        tol: float | None = None,
         signed: bool = False,
     ) -> NDArray:
         """Compute the distance of a set of points to the nearest detector surface.
@@ -175,6 +259,8 @@ class HPGe(ABC, geant4.LogicalVolume):
         tol
             distance outside the surface which is considered inside. Should be
             on the order of numerical precision of the floating point representation.
+            If ``None`` (the default), ``1e-11`` or for ``float32`` detectors a
+            few units of the floating point precision at the detector size.
         signed
             whether to return signed distanced (inside the HPGe is positive,
             outside is negative).
@@ -184,41 +270,223 @@ class HPGe(ABC, geant4.LogicalVolume):
         - Only implemented for solids based on :class:`geant4.solid.GenericPolycone`
         - Coordinates should be relative to the origin of the polycone.
         """
-        # check type of the solid
-        if not isinstance(self.solid, geant4.solid.GenericPolycone):
-            msg = f"distance_to_surface is not implemented for {type(self.solid)} yet"
-            raise NotImplementedError(msg)
+        self._check_polycone("distance_to_surface")
+        tol = self._tol if tol is None else tol
+        coords_rz = self._get_coords_rz(coords, self._r.dtype)
+
+        dists = np.empty(len(coords_rz), dtype=coords_rz.dtype)
+        utils.polyline_min_dist(
+            coords_rz, *self._get_segments(surface_indices), tol, signed, dists
+        )
+
+        return dists
+
+    @staticmethod
+    def distance_to_surface_batch(
+        coords: ArrayLike,
+        detectors: Sequence[HPGe],
+        surface_indices: ArrayLike | None = None,
+        tol: float | None = None,
+        signed: bool = False,
+    ) -> NDArray:
+        """Compute the distance of a set of points to the nearest surface of several detectors.
+
+        Equivalent to calling :meth:`distance_to_surface` for each detector,
+        but the coordinates are checked and converted to `(r,z)` only once.
+
+        Parameters
+        ----------
+        coords
+            2D array of shape `(n,3)` of `(x,y,z)` coordinates for each of `n`
+            points, second index corresponds to `(x,y,z)`.
+        detectors
+            sequence of `k` detectors.
+        surface_indices
+            list of indices of surfaces to consider, for all detectors. If
+            ``None`` (the default) all surfaces used.
+        tol
+            distance outside the surface which is considered inside. Should be
+            on the order of numerical precision of the floating point representation.
+            If ``None`` (the default), ``1e-11`` or for ``float32`` detectors a
+            few units of the floating point precision at the detector size.
+        signed
+            whether to return signed distanced (inside the HPGe is positive,
+            outside is negative).
+
+        Returns
+        -------
+            array of shape `(n,k)` with the distance of each point to each
+            detector.
 
-        if not isinstance(coords, np.ndarray):
-            coords = np.array(coords)
+        Note
+        ----
+        Coordinates should be relative to the origin of the polycones.
+        """
+        for det in detectors:
+            det._check_polycone("distance_to_surface_batch")
+
+        # convert the coordinates once for each working precision
+        coords_rz = HPGe._get_coords_rz(coords, np.float64)
+        coords_rz_by_dtype = {
+            dtype: coords_rz.astype(dtype, copy=False)
+            for dtype in {det._r.dtype for det in detectors}
+        }
+
+        dists = np.empty((len(detectors), len(coords_rz)))
+        for k, det in enumerate(detectors):
+            utils.polyline_min_dist(
+                coords_rz_by_dtype[det._r.dtype],
+                *det._get_segments(surface_indices),
+                det._tol if tol is None else tol,
+                signed,
+                dists[k],
+            )
+
+        return dists.T
+
+    def _get_device_arrays(self) -> tuple:
+        """Get the cached profile and segment arrays on the CUDA device."""
+        if self._device_arrays is None:
+            self._device_arrays = tuple(
+                cuda.to_device(a)
+                for a in (
+                    self._r,
+                    self._z,
+                    # bounding box of the profile, for the inside check
+                    np.array(
+                        [self._r.min(), self._r.max(), self._z.min(), self._z.max()]
+                    ),
+                    self._seg_s1,
+                    self._seg_d,
+                    self._seg_inv_len2,
+                )
+            )
+        return self._device_arrays
+
+    def _get_device_coords(self, coords: ArrayLike):
+        """Check the input `(x,y,z)` coordinates and move them to the CUDA device."""
+        # device arrays from numba (or its simulator) and other CUDA libraries
+        on_device = hasattr(coords, "__cuda_array_interface__") or hasattr(
+            coords, "copy_to_host"
+        )
+        if not on_device:
+            coords = cuda.to_device(np.ascontiguousarray(coords, dtype=self._r.dtype))
 
-        if np.shape(coords)[1] != 3:
+        if len(coords.shape) != 2 or coords.shape[1] != 3:
             msg = "coords must be provided as a 2D array with x,y,z coordinates for each point."
             raise ValueError(msg)
 
-        # get the coordinates
-        r, z = self.get_profile()
-        s1, s2 = utils.get_line_segments(r, z, surface_indices=surface_indices)
+        return coords
 
-        # convert coords
-        coords_rz = utils.convert_coords(coords)
+    def distance_to_surface_gpu(
+        self,
+        coords: ArrayLike,
+        surface_indices: ArrayLike | None = None,
+        tol: float | None = None,
+        signed: bool = False,
+    ):
+        """Compute the distance of a set of points to the nearest detector surface on a CUDA GPU.
 
-        return utils.iterate_segments(s1, s2, coords_rz, tol, signed)
+        Same as :meth:`distance_to_surface`, but each point is processed by
+        a CUDA thread. Worth it for large numbers of points, especially if
+        they already are on the device.
+
+        Parameters
+        ----------
+        coords
+            2D array of shape `(n,3)` of `(x,y,z)` coordinates for each of `n`
+            points, either a CUDA device array or a host array (which is then
+            copied to the device).
+        surface_indices
+            list of indices of surfaces to consider. If ``None`` (the default)
+            all surfaces used.
+        tol
+            distance outside the surface which is considered inside. Should be
+            on the order of numerical precision of the floating point representation.
+            If ``None`` (the default), ``1e-11`` or for ``float32`` detectors a
+            few units of the floating point precision at the detector size.
+        signed
+            whether to return signed distanced (inside the HPGe is positive,
+            outside is negative).
+
+        Returns
+        -------
+            CUDA device array of shape `(n,)`, use ``copy_to_host()`` to get a
+            NumPy array.
+        """
+        self._check_polycone("distance_to_surface_gpu")
+        tol = self._tol if tol is None else tol
+        coords = self._get_device_coords(coords)
+
+        if surface_indices is None:
+            segments = self._get_device_arrays()[3:]
+        else:
+            segments = tuple(
+                cuda.to_device(np.ascontiguousarray(a))
+                for a in self._get_segments(surface_indices)
+            )
+
+        dists = cuda.device_array(coords.shape[0], dtype=self._r.dtype)
+        blocks = (
+            coords.shape[0] + _CUDA_THREADS_PER_BLOCK - 1
+        ) // _CUDA_THREADS_PER_BLOCK
+        utils.polyline_min_dist_cuda[blocks, _CUDA_THREADS_PER_BLOCK](
+            coords, *segments, tol, signed, dists
+        )
+
+        return dists
+
+    def is_inside_gpu(self, coords: ArrayLike, tol: float | None = None):
+        """Compute whether each point is inside the volume on a CUDA GPU.
+
+        Same as :meth:`is_inside`, but each point is processed by a CUDA
+        thread.
+
+        Parameters
+        ----------
+        coords
+            2D array of shape `(n,3)` of `(x,y,z)` coordinates for each of `n`
+            points, either a CUDA device array or a host array (which is then
+            copied to the device).
+        tol
+            distance outside the surface which is considered inside. Should be
+            on the order of numerical precision of the floating point representation.
+            If ``None`` (the default), ``1e-11`` or for ``float32`` detectors a
+            few units of the floating point precision at the detector size.
+
+        Returns
+        -------
+            CUDA device array of shape `(n,)` of ``uint8`` (``1`` if inside),
+            use ``copy_to_host()`` to get a NumPy array.
+        """
+        self._check_polycone("is_inside_gpu")
+        tol = self._tol if tol is None else tol
+        coords = self._get_device_coords(coords)
+        r, z, bounds = self._get_device_arrays()[:3]
+
+        inside = cuda.device_array(coords.shape[0], dtype=np.uint8)
+        blocks = (
+            coords.shape[0] + _CUDA_THREADS_PER_BLOCK - 1
+        ) // _CUDA_THREADS_PER_BLOCK
+        utils.polyline_inside_cuda[blocks, _CUDA_THREADS_PER_BLOCK](
+            coords, r, z, bounds, tol, inside
+        )
+
+        return inside
+
+    def _polycone_volume(self) -> float:
+        """Volume of the polycone described by the ``(r, z)`` profile, in mm^3."""
+        r, z = self._profile
+        r1 = np.roll(r, 1)
+        z1 = np.roll(z, 1)
+
+        volume = np.sum((r1 * r1 + r1 * r + r * r) * (z - z1))
+        return float(2 * math.pi * abs(volume) / 6)
 
     @property
     def volume(self) -> Quantity:
         """Volume of the HPGe."""
-        volume = 0
-        r1 = self.solid.pR[-1]
-        z1 = self.solid.pZ[-1]
-        for i in range(len(self.solid.pZ)):
-            r2 = self.solid.pR[i]
-            z2 = self.solid.pZ[i]
-            volume += (r1 * r1 + r1 * r2 + r2 * r2) * (z2 - z1)
-            r1 = r2
-            z1 = z2
-
-        return (2 * math.pi * abs(volume) / 6) * u.mm**3
+        return self._polycone_volume() * u.mm**3
 
     @property
     def mass(self) -> Quantity:
@@ -247,15 +515,12 @@ class HPGe(ABC, geant4.LogicalVolume):
         if not isinstance(self.solid, geant4.solid.GenericPolycone):
             logging.warning("The area is that of the solid without cut")
 
-        r, z = self.get_profile()
-
-        r = np.array(r)
-        z = np.array(z)
+        r, z = self._profile
 
-        dr = np.array([r2 - r1 for r1, r2 in pairwise(r)])
-        sr = np.array([r2 + r1 for r1, r2 in pairwise(r)])
-        dz = np.array([z2 - z1 for z1, z2 in pairwise(z)])
-        dl = np.sqrt(np.power(dr, 2) + np.power(dz, 2))
+        dr = np.diff(r)
+        dz = np.diff(z)
+        dl = np.hypot(dr, dz)
+        sr = r[1:] + r[:-1]
         r0 = r[:-1]
 
         if surface_indices is not None:
@@ -264,8 +529,8 @@ class HPGe(ABC, geant4.LogicalVolume):
             dl = dl[surface_indices]
             r0 = r0[surface_indices]
             sr = sr[surface_indices]
-        return np.where(
-            dr == 0,
-            abs(dz) * r0 * 2 * np.pi * u.mm**2,
-            abs(dr) * dl * np.pi * u.mm**2,
+
+        # lateral area of the frustum, pi * (r1 + r2) * l
+        return (
+            np.where(dr == 0, np.abs(dz) * r0 * (2 * np.pi), sr * dl * np.pi) * u.mm**2
         )
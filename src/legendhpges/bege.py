@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import math
+import numpy as np
 
 from .base import HPGe
 from .build_utils import make_pplus
@@ -12,47 +12,41 @@ class BEGe(HPGe):
     def _decode_polycone_coord(self):
         c = self.metadata.geometry
 
-        def _tan(a):
-            return math.tan(math.pi * a / 180)
+        # tangents of the taper angles
+        tan_bottom, tan_top = np.tan(
+            np.deg2rad([c.taper.bottom.angle_in_deg, c.taper.top.angle_in_deg])
+        ).tolist()
 
-        r = []
-        z = []
-        surfaces = []
-
-        r_p, z_p, surface_p = make_pplus(c)
-        r += r_p
-        z += z_p
-        surfaces += surface_p
+        r, z, surfaces = make_pplus(c)
 
         if c.taper.bottom.height_in_mm > 0:
-            r += [
-                c.radius_in_mm
-                - c.taper.bottom.height_in_mm * _tan(c.taper.bottom.angle_in_deg),
-                c.radius_in_mm,
-            ]
-            z += [0, c.taper.bottom.height_in_mm]
-            surfaces += ["nplus", "nplus"]
+            r.extend(
+                (
+                    c.radius_in_mm - c.taper.bottom.height_in_mm * tan_bottom,
+                    c.radius_in_mm,
+                )
+            )
+            z.extend((0, c.taper.bottom.height_in_mm))
+            surfaces.extend(("nplus", "nplus"))
         else:
-            r += [c.radius_in_mm]
-            z += [0]
-            surfaces += ["nplus"]
+            r.append(c.radius_in_mm)
+            z.append(0)
+            surfaces.append("nplus")
 
         if c.taper.top.height_in_mm > 0:
-            r += [
-                c.radius_in_mm,
-                c.radius_in_mm
-                - c.taper.top.height_in_mm * _tan(c.taper.top.angle_in_deg),
-            ]
-            z += [c.height_in_mm - c.taper.top.height_in_mm, c.height_in_mm]
-            surfaces += ["nplus", "nplus"]
+            r.extend(
+                (c.radius_in_mm, c.radius_in_mm - c.taper.top.height_in_mm * tan_top)
+            )
+            z.extend((c.height_in_mm - c.taper.top.height_in_mm, c.height_in_mm))
+            surfaces.extend(("nplus", "nplus"))
         else:
-            r += [c.radius_in_mm]
-            z += [c.height_in_mm]
-            surfaces += ["nplus"]
+            r.append(c.radius_in_mm)
+            z.append(c.height_in_mm)
+            surfaces.append("nplus")
 
-        r += [0]
-        z += [c.height_in_mm]
-        surfaces += ["nplus"]
+        r.append(0)
+        z.append(c.height_in_mm)
+        surfaces.append("nplus")
 
         self.surfaces = surfaces
 
@@ -17,49 +17,33 @@ def make_pplus(geometry: Mapping) -> tuple[list, list, list]:
     -------
         Tuple ``(r,z,surfaces)`` of lists of r,z coordinates and surface names.
     """
+    # read the parameters once
+    pp_radius = geometry.pp_contact.radius_in_mm
+    pp_depth = geometry.pp_contact.depth_in_mm
+    groove_inner = geometry.groove.radius_in_mm.inner
+    groove_outer = geometry.groove.radius_in_mm.outer
+    groove_depth = geometry.groove.depth_in_mm
+
     r = []
     z = []
     surfaces = []
 
-    if geometry.pp_contact.depth_in_mm > 0:
-        r += [
-            0,
-            geometry.pp_contact.radius_in_mm,
-            geometry.pp_contact.radius_in_mm,
-            geometry.groove.radius_in_mm.inner,
-        ]
-        z += [
-            geometry.pp_contact.depth_in_mm,
-            geometry.pp_contact.depth_in_mm,
-            0,
-            0,
-        ]
-        surfaces += ["pplus", "passive", "passive"]
+    if pp_depth > 0:
+        r.extend((0, pp_radius, pp_radius, groove_inner))
+        z.extend((pp_depth, pp_depth, 0, 0))
+        surfaces.extend(("pplus", "passive", "passive"))
 
-    elif geometry.pp_contact.radius_in_mm < geometry.groove.radius_in_mm.inner:
-        r += [
-            0,
-            geometry.pp_contact.radius_in_mm,
-            geometry.groove.radius_in_mm.inner,
-        ]
-        z += [0, 0, 0]
-        surfaces += ["pplus", "passive"]
+    elif pp_radius < groove_inner:
+        r.extend((0, pp_radius, groove_inner))
+        z.extend((0, 0, 0))
+        surfaces.extend(("pplus", "passive"))
     else:
-        r += [0, geometry.pp_contact.radius_in_mm]
-        z += [0, 0]
-        surfaces += ["pplus"]
-
-    r += [
-        geometry.groove.radius_in_mm.inner,
-        geometry.groove.radius_in_mm.outer,
-        geometry.groove.radius_in_mm.outer,
-    ]
+        r.extend((0, pp_radius))
+        z.extend((0, 0))
+        surfaces.append("pplus")
 
-    z += [
-        geometry.groove.depth_in_mm,
-        geometry.groove.depth_in_mm,
-        0,
-    ]
-    surfaces += ["passive", "passive", "passive"]
+    r.extend((groove_inner, groove_outer, groove_outer))
+    z.extend((groove_depth, groove_depth, 0))
+    surfaces.extend(("passive", "passive", "passive"))
 
     return (r, z, surfaces)
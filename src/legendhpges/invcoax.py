@@ -1,11 +1,7 @@
 from __future__ import annotations
 
-import math
-
-import awkward as ak
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
-from pyg4ometry import geant4
 
 from . import utils
 from .base import HPGe
@@ -24,110 +20,88 @@ class InvertedCoax(HPGe):
     def _decode_polycone_coord(self) -> tuple[list[float], list[float]]:
         c = self.metadata.geometry
 
-        def _tan(a):
-            return math.tan(math.pi * a / 180)
-
-        r = []
-        z = []
-        surfaces = []
+        # read the parameters once
+        radius = c.radius_in_mm
+        height = c.height_in_mm
+        bottom_height = c.taper.bottom.height_in_mm
+        top_height = c.taper.top.height_in_mm
+        bh_radius = c.borehole.radius_in_mm
+        bh_depth = c.borehole.depth_in_mm
+        bh_taper_height = c.taper.borehole.height_in_mm
+
+        # tangents of the taper angles
+        tan_bottom, tan_top, tan_borehole = np.tan(
+            np.deg2rad(
+                [
+                    c.taper.bottom.angle_in_deg,
+                    c.taper.top.angle_in_deg,
+                    c.taper.borehole.angle_in_deg,
+                ]
+            )
+        ).tolist()
 
         # save the borehole coords
         borehole_r = []
         borehole_z = []
 
-        r_p, z_p, surface_p = make_pplus(c)
-        r += r_p
-        z += z_p
-        surfaces += surface_p
-
-        if c.taper.bottom.height_in_mm > 0:
-            r += [
-                c.radius_in_mm
-                - c.taper.bottom.height_in_mm * _tan(c.taper.bottom.angle_in_deg),
-                c.radius_in_mm,
-            ]
+        r, z, surfaces = make_pplus(c)
 
-            z += [
-                0,
-                c.taper.bottom.height_in_mm,
-            ]
-            surfaces += ["nplus", "nplus"]
+        if bottom_height > 0:
+            r.extend((radius - bottom_height * tan_bottom, radius))
+            z.extend((0, bottom_height))
+            surfaces.extend(("nplus", "nplus"))
 
         else:
-            r += [c.radius_in_mm]
-            z += [0]
-            surfaces += ["nplus"]
-
-        if c.taper.top.height_in_mm > 0:
-            r += [
-                c.radius_in_mm,
-                c.radius_in_mm
-                - c.taper.top.height_in_mm * _tan(c.taper.top.angle_in_deg),
-            ]
-
-            z += [
-                c.height_in_mm - c.taper.top.height_in_mm,
-                c.height_in_mm,
-            ]
-            surfaces += ["nplus", "nplus"]
+            r.append(radius)
+            z.append(0)
+            surfaces.append("nplus")
+
+        if top_height > 0:
+            r.extend((radius, radius - top_height * tan_top))
+            z.extend((height - top_height, height))
+            surfaces.extend(("nplus", "nplus"))
 
         else:
-            r += [c.radius_in_mm]
-            z += [c.height_in_mm]
-            surfaces += ["nplus"]
+            r.append(radius)
+            z.append(height)
+            surfaces.append("nplus")
 
         # first point of the borehole
-        borehole_r += [0]
-        borehole_z += [c.height_in_mm]
-
-        if c.taper.borehole.height_in_mm > 0:
-            r += [
-                c.borehole.radius_in_mm
-                + c.taper.borehole.height_in_mm * _tan(c.taper.borehole.angle_in_deg),
-                c.borehole.radius_in_mm,
-            ]
-
-            z += [
-                c.height_in_mm,
-                c.height_in_mm - c.taper.borehole.height_in_mm,
-            ]
-            surfaces += ["nplus", "nplus"]
+        borehole_r.append(0)
+        borehole_z.append(height)
+
+        if bh_taper_height > 0:
+            r.extend((bh_radius + bh_taper_height * tan_borehole, bh_radius))
+            z.extend((height, height - bh_taper_height))
+            surfaces.extend(("nplus", "nplus"))
 
             # add borehole coords
-            borehole_r += r[-2:]
-            borehole_z += z[-2:]
+            borehole_r.extend(r[-2:])
+            borehole_z.extend(z[-2:])
         else:
-            r += [c.borehole.radius_in_mm]
-            z += [c.height_in_mm]
-            surfaces += ["nplus"]
+            r.append(bh_radius)
+            z.append(height)
+            surfaces.append("nplus")
 
-            borehole_r += [r[-1]]
-            borehole_z += [z[-1]]
+            borehole_r.append(r[-1])
+            borehole_z.append(z[-1])
 
         # add borehole with or without tapering
-        if c.taper.borehole.height_in_mm != c.borehole.depth_in_mm:
-            r += [
-                c.borehole.radius_in_mm,
-                0,
-            ]
+        if bh_taper_height != bh_depth:
+            r.extend((bh_radius, 0))
+            z.extend((height - bh_depth, height - bh_depth))
+            surfaces.extend(("nplus", "nplus"))
 
-            z += [
-                c.height_in_mm - c.borehole.depth_in_mm,
-                c.height_in_mm - c.borehole.depth_in_mm,
-            ]
-            surfaces += ["nplus", "nplus"]
-
-            borehole_r += r[-2:]
-            borehole_z += z[-2:]
+            borehole_r.extend(r[-2:])
+            borehole_z.extend(z[-2:])
 
         else:
-            r += [0]
-
-            z += [c.height_in_mm - c.borehole.depth_in_mm]
-            surfaces += ["nplus"]
+            r.append(0)
+            z.append(height - bh_depth)
+            surfaces.append("nplus")
 
-            borehole_r += [r[-1]]
-            borehole_z += [z[-1]]
+            borehole_r.append(r[-1])
+            borehole_z.append(z[-1])
 
         self.surfaces = surfaces
 
@@ -151,36 +125,18 @@ class InvertedCoax(HPGe):
             distance outside the surface which is considered inside. Should be
             on the order of numerical precision of the floating point representation.
         """
-        if not isinstance(self.solid, geant4.solid.GenericPolycone):
-            msg = f"is_inside_borehole is not implemented for {type(self.solid)} yet"
-            raise NotImplementedError(msg)
-
-        if not isinstance(coords, np.ndarray):
-            coords = np.array(coords)
-
-        if np.shape(coords)[1] != 3:
-            msg = "coords must be provided as a 2D array with x,y,z coordinates for each point."
-            raise ValueError(msg)
-
-        r, z = self.borehole_r, self.borehole_z
-
-        coords_rz = utils.convert_coords(coords)
-        s1, s2 = utils.get_line_segments(r, z)
-
-        # get the distance for each line segment
-        dists = utils.shortest_distance(s1, s2, coords_rz, tol, signed=True)
-
-        # find the minimal distance
-        # if we have two of the same sign take the negative value
-        # this is correct as long as we dont have angles > 180 deg
-
-        abs_arr = np.abs(dists)
-        min_vals = ak.min(abs_arr, axis=1)
-
-        is_min = ak.Array(np.isclose(abs_arr, min_vals[:, np.newaxis]))
-        dists = ak.Array(dists)
-
-        min_dist = ak.min(dists[is_min], axis=-1)
-        sign = ak.where(min_dist >= 0, True, False)
-
-        return sign.to_numpy()
+        self._check_polycone("is_inside_borehole")
+        coords_rz = self._get_coords_rz(coords, np.float64)
+
+        # the borehole profile is closed along the symmetry axis, which is not
+        # part of the surface
+        inside = np.empty(len(coords_rz), dtype=bool)
+        utils.polyline_inside(
+            coords_rz,
+            np.asarray(self.borehole_r, dtype=np.float64),
+            np.asarray(self.borehole_z, dtype=np.float64),
+            tol,
+            inside,
+        )
+
+        return inside
@@ -47,6 +47,9 @@ def make_hpge(
         material
             pyg4ometry Geant4 material for the detector.
 
+        Any other keyword argument (e.g. ``precision``) is forwarded to the
+        :class:`.HPGe` constructor.
+
     Examples
     --------
         >>> gedet = make_hpge(metadata, registry)
@@ -50,6 +50,7 @@ def _number_density_theo() -> Quantity:
     return (8 / a**3).to("cm^-3")
 
 
+@functools.cache
 def _number_density_meas() -> Quantity:
     """Calculate the measured number density of germanium.
 
@@ -93,6 +94,7 @@ def make_natural_germanium(
     )
 
 
+@functools.lru_cache(maxsize=128)
 def enriched_germanium_density(ge76_fraction: float = 0.92) -> Quantity:
     """Calculate the density of enriched germanium.
 
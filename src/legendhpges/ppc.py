@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import math
+import numpy as np
 
 from .base import HPGe
 
@@ -11,52 +11,53 @@ class PPC(HPGe):
     def _decode_polycone_coord(self):
         c = self.metadata.geometry
 
-        def _tan(a):
-            return math.tan(math.pi * a / 180)
+        # tangents of the taper angles
+        tan_bottom, tan_top = np.tan(
+            np.deg2rad([c.taper.bottom.angle_in_deg, c.taper.top.angle_in_deg])
+        ).tolist()
 
         r = []
         z = []
         surfaces = []
 
         if c.pp_contact.depth_in_mm > 0:
-            r += [0, c.pp_contact.radius_in_mm, c.pp_contact.radius_in_mm]
-            z += [c.pp_contact.depth_in_mm, c.pp_contact.depth_in_mm, 0]
-            surfaces += ["pplus", "passive"]
+            r.extend((0, c.pp_contact.radius_in_mm, c.pp_contact.radius_in_mm))
+            z.extend((c.pp_contact.depth_in_mm, c.pp_contact.depth_in_mm, 0))
+            surfaces.extend(("pplus", "passive"))
 
         else:
-            r += [0, c.pp_contact.radius_in_mm]
-            z += [0, 0]
-            surfaces += ["pplus"]
+            r.extend((0, c.pp_contact.radius_in_mm))
+            z.extend((0, 0))
+            surfaces.append("pplus")
 
         if c.taper.bottom.height_in_mm > 0:
-            r += [
-                c.radius_in_mm
-                - c.taper.bottom.height_in_mm * _tan(c.taper.bottom.angle_in_deg),
-                c.radius_in_mm,
-            ]
-            z += [0, c.taper.bottom.height_in_mm]
-            surfaces += ["passive", "nplus"]
+            r.extend(
+                (
+                    c.radius_in_mm - c.taper.bottom.height_in_mm * tan_bottom,
+                    c.radius_in_mm,
+                )
+            )
+            z.extend((0, c.taper.bottom.height_in_mm))
+            surfaces.extend(("passive", "nplus"))
         else:
-            r += [c.radius_in_mm]
-            z += [0]
-            surfaces += ["passive"]
+            r.append(c.radius_in_mm)
+            z.append(0)
+            surfaces.append("passive")
 
         if c.taper.top.height_in_mm > 0:
-            r += [
-                c.radius_in_mm,
-                c.radius_in_mm
-                - c.taper.top.height_in_mm * _tan(c.taper.top.angle_in_deg),
-            ]
-            z += [c.height_in_mm - c.taper.top.height_in_mm, c.height_in_mm]
-            surfaces += ["nplus", "nplus"]
+            r.extend(
+                (c.radius_in_mm, c.radius_in_mm - c.taper.top.height_in_mm * tan_top)
+            )
+            z.extend((c.height_in_mm - c.taper.top.height_in_mm, c.height_in_mm))
+            surfaces.extend(("nplus", "nplus"))
         else:
-            r += [c.radius_in_mm]
-            z += [c.height_in_mm]
-            surfaces += ["nplus"]
+            r.append(c.radius_in_mm)
+            z.append(c.height_in_mm)
+            surfaces.append("nplus")
 
-        r += [0]
-        z += [c.height_in_mm]
-        surfaces += ["nplus"]
+        r.append(0)
+        z.append(c.height_in_mm)
+        surfaces.append("nplus")
 
         self.surfaces = surfaces
 
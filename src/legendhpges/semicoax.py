@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import math
+import numpy as np
 
 from .base import HPGe
 
@@ -11,69 +11,80 @@ class SemiCoax(HPGe):
     def _decode_polycone_coord(self):
         c = self.metadata.geometry
 
-        def _tan(a):
-            return math.tan(math.pi * a / 180)
+        # tangents of the taper angles
+        tan_bottom, tan_top, tan_borehole = np.tan(
+            np.deg2rad(
+                [
+                    c.taper.bottom.angle_in_deg,
+                    c.taper.top.angle_in_deg,
+                    c.taper.borehole.angle_in_deg,
+                ]
+            )
+        ).tolist()
 
         r = []
         z = []
         surfaces = []
 
-        r += [0, c.borehole.radius_in_mm]
-        z += [c.borehole.depth_in_mm, c.borehole.depth_in_mm]
-        surfaces += ["pplus"]
+        r.extend((0, c.borehole.radius_in_mm))
+        z.extend((c.borehole.depth_in_mm, c.borehole.depth_in_mm))
+        surfaces.append("pplus")
 
         if c.taper.borehole.height_in_mm > 0:
-            r += [
-                c.borehole.radius_in_mm,
-                c.borehole.radius_in_mm
-                + c.taper.borehole.height_in_mm * _tan(c.taper.borehole.angle_in_deg),
-            ]
-            z += [c.taper.borehole.height_in_mm, 0]
-            surfaces += ["pplus", "pplus"]
+            r.extend(
+                (
+                    c.borehole.radius_in_mm,
+                    c.borehole.radius_in_mm
+                    + c.taper.borehole.height_in_mm * tan_borehole,
+                )
+            )
+            z.extend((c.taper.borehole.height_in_mm, 0))
+            surfaces.extend(("pplus", "pplus"))
         else:
-            r += [c.borehole.radius_in_mm]
-            z += [0]
-            surfaces += ["pplus"]
+            r.append(c.borehole.radius_in_mm)
+            z.append(0)
+            surfaces.append("pplus")
 
-        r += [
-            c.groove.radius_in_mm.inner,
-            c.groove.radius_in_mm.inner,
-            c.groove.radius_in_mm.outer,
-            c.groove.radius_in_mm.outer,
-        ]
+        r.extend(
+            (
+                c.groove.radius_in_mm.inner,
+                c.groove.radius_in_mm.inner,
+                c.groove.radius_in_mm.outer,
+                c.groove.radius_in_mm.outer,
+            )
+        )
 
-        z += [0, c.groove.depth_in_mm, c.groove.depth_in_mm, 0]
-        surfaces += ["pplus", "passive", "passive", "passive"]
+        z.extend((0, c.groove.depth_in_mm, c.groove.depth_in_mm, 0))
+        surfaces.extend(("pplus", "passive", "passive", "passive"))
 
         if c.taper.bottom.height_in_mm > 0:
-            r += [
-                c.radius_in_mm
-                - c.taper.bottom.height_in_mm * _tan(c.taper.bottom.angle_in_deg),
-                c.radius_in_mm,
-            ]
-            z += [0, c.taper.bottom.height_in_mm]
-            surfaces += ["nplus", "nplus"]
+            r.extend(
+                (
+                    c.radius_in_mm - c.taper.bottom.height_in_mm * tan_bottom,
+                    c.radius_in_mm,
+                )
+            )
+            z.extend((0, c.taper.bottom.height_in_mm))
+            surfaces.extend(("nplus", "nplus"))
         else:
-            r += [c.radius_in_mm]
-            z += [0]
-            surfaces += ["nplus"]
+            r.append(c.radius_in_mm)
+            z.append(0)
+            surfaces.append("nplus")
 
         if c.taper.top.height_in_mm > 0:
-            r += [
-                c.radius_in_mm,
-                c.radius_in_mm
-                - c.taper.top.height_in_mm * _tan(c.taper.top.angle_in_deg),
-            ]
-            z += [c.height_in_mm - c.taper.top.height_in_mm, c.height_in_mm]
-            surfaces += ["nplus", "nplus"]
+            r.extend(
+                (c.radius_in_mm, c.radius_in_mm - c.taper.top.height_in_mm * tan_top)
+            )
+            z.extend((c.height_in_mm - c.taper.top.height_in_mm, c.height_in_mm))
+            surfaces.extend(("nplus", "nplus"))
         else:
-            r += [c.radius_in_mm]
-            z += [c.height_in_mm]
-            surfaces += ["nplus"]
+            r.append(c.radius_in_mm)
+            z.append(c.height_in_mm)
+            surfaces.append("nplus")
 
-        r += [0]
-        z += [c.height_in_mm]
-        surfaces += ["nplus"]
+        r.append(0)
+        z.append(c.height_in_mm)
+        surfaces.append("nplus")
 
         self.surfaces = surfaces
         return r, z
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import json
 import logging
+import math
 from pathlib import Path
 
 import numba
 import numpy as np
+import orjson
 import yaml
+from numba import cuda
 from numpy.typing import ArrayLike, NDArray
 
 log = logging.getLogger(__name__)
@@ -26,9 +28,10 @@ def load_dict(fname: str, ftype: str | None = None) -> dict:
     msg = f"loading {ftype} dict from: {fname}"
     log.debug(msg)
 
+    if ftype == "json":
+        return orjson.loads(fname.read_bytes())
+
     with fname.open() as f:
-        if ftype == "json":
-            return json.load(f)
         if ftype == "yaml":
             return yaml.safe_load(f)
 
@@ -142,9 +145,11 @@ def get_line_segments(
         `s2` have shape `(n_segments,2)` where the first axis represents thhe
         segment and the second `(r,z)`.
     """
-    # build lists of pairs of coordinates
-    s1 = np.array([np.array([r1, z1]) for r1, z1 in zip(r[:-1], z[:-1], strict=True)])
-    s2 = np.array([np.array([r2, z2]) for r2, z2 in zip(r[1:], z[1:], strict=True)])
+    # build arrays of pairs of coordinates
+    r = np.asarray(r, dtype=np.float64)
+    z = np.asarray(z, dtype=np.float64)
+    s1 = np.column_stack((r[:-1], z[:-1]))
+    s2 = np.column_stack((r[1:], z[1:]))
 
     if surface_indices is not None:
         s1 = s1[surface_indices]
@@ -153,6 +158,32 @@ def get_line_segments(
     return s1, s2
 
 
+def get_segment_arrays(r: ArrayLike, z: ArrayLike) -> tuple[NDArray, NDArray, NDArray]:
+    """Extracts the line segments from a shape in a form suitable for :func:`polyline_min_dist`.
+
+    Parameters
+    ---------
+    r
+        array or list of radial positions defining the polycone.
+    z
+        array or list of vertical positions defining the polycone.
+
+    Returns
+    -------
+        tuple of (s1,d,inv_len2) arrays, where `s1` and `d` have shape
+        `(n_segments,2)` and describe the first point and the vector
+        :math:`s_2 - s_1` of each segment, and `inv_len2` the inverse squared
+        length of each segment (zero for degenerate segments).
+    """
+    s1, s2 = get_line_segments(r, z)
+    d = s2 - s1
+
+    len2 = np.einsum("mi,mi->m", d, d)
+    inv_len2 = np.divide(1.0, len2, out=np.zeros_like(len2), where=len2 > 0)
+
+    return s1, d, inv_len2
+
+
 @numba.njit(cache=True)
 def shortest_grid_distance(points, s1, s2, axis, signed=True, sign_factor=1):
     other_axis = int(~bool(axis))
@@ -414,86 +445,226 @@ def shortest_distance(
     return dists
 
 
-@numba.njit(cache=True)
-def iterate_segments(s1, s2, coords_rz, tol, signed):
-    # first sort by lengths longest first
-    segment_lengths = np.sum((s1 - s2) ** 2, axis=1)
-    sort_indices = np.argsort(segment_lengths)[::-1]
-    s1 = s1[sort_indices]
-    s2 = s2[sort_indices]
-
-    dists = np.full(len(coords_rz), np.inf)
-    diffs = s1 - s2
-    perps = np.abs(diffs[:, 0] * diffs[:, 1]) < tol
-    perp_indices = np.where(perps)[0]
-    non_perp_indices = np.where(~perps)[0]
-
-    # get shortest distance to vertical/horizontal surfaces
-    if len(perp_indices) > 0:
-        for start, end in zip(s1[perp_indices], s2[perp_indices]):  # noqa: B905
-            if (dists == np.inf).all():
-                candidates = np.arange(0, len(coords_rz))
-            else:
-                diff_x = np.abs(end[0] - start[0])
-                axis = 0 if diff_x < tol else 1
-                diff_start = np.abs(coords_rz - start)[:, axis]
-                abs_dists = np.abs(dists)
-                candidates = np.where(diff_start < abs_dists)[0]
-                # only calculate for these if
-                # and between s1 and s2 or dist
-                # in both dimensions to s1/s2 < current min
-                # candidates = np.where(between | close)[0]
-
-            if len(candidates) > 0:
-                start_array = np.ascontiguousarray(start).reshape(1, -1)
-                end_array = np.ascontiguousarray(end).reshape(1, -1)
-
-                dist_candidates = shortest_distance(
-                    start_array,
-                    end_array,
-                    coords_rz[candidates],
-                    tol=tol,
-                    signed=signed,
-                ).flatten()
-
-                mask = np.abs(dist_candidates) < np.abs(dists[candidates])
-                # print(candidates[mask])
-                dists[candidates[mask]] = dist_candidates[mask]
-
-    # compute shortest distances to remaining surfaces
-    # this condition could probably be tightened
-    if len(non_perp_indices) > 0:
-        for start, end in zip(s1[non_perp_indices], s2[non_perp_indices]):  # noqa: B905
-            # Calculate distance to endpoints
-            dist_to_start_sq = np.sum((coords_rz - start) ** 2, axis=1)
-            dist_to_end_sq = np.sum((coords_rz - end) ** 2, axis=1)
-
-            # Calculate segment length
-            segment_length_sq = np.sum((end - start) ** 2)
-
-            # Triangle inequality test:
-            # If a point is closer to the segment than its current min distance,
-            # then at least one of these must be true:
-            # 1. It's within (current_dist + segment_length) of the start point
-            # 2. It's within (current_dist + segment_length) of the end point
-
-            threshold_dist_sq = (
-                dists**2 + segment_length_sq + (2 * dists * segment_length_sq)
-            )
+def _point_min_dist(pr, pz, s1, d, inv_len2, tol, signed):
+    # shortest (signed) distance from the point (pr, pz) to the segments
+    best_dist2 = math.inf
+    best_perp = 0.0
 
-            candidates = np.where(
-                (dist_to_start_sq < threshold_dist_sq)
-                | (dist_to_end_sq < threshold_dist_sq)
-            )[0]
-
-            if len(candidates) > 0:
-                dist_candidates = shortest_distance(
-                    np.ascontiguousarray(start).reshape(1, -1),
-                    np.ascontiguousarray(end).reshape(1, -1),
-                    coords_rz[candidates, :],
-                    tol=tol,
-                    signed=signed,
-                ).flatten()
-                mask = np.abs(dist_candidates) < np.abs(dists[candidates])
-                dists[candidates[mask]] = dist_candidates[mask]
-    return dists
+    for j in range(len(s1)):
+        dr = d[j, 0]
+        dz = d[j, 1]
+        qr = pr - s1[j, 0]
+        qz = pz - s1[j, 1]
+
+        # clamped projection of the point on the segment
+        t = min(max((qr * dr + qz * dz) * inv_len2[j], 0.0), 1.0)
+
+        er = qr - t * dr
+        ez = qz - t * dz
+        dist2 = er * er + ez * ez
+
+        if dist2 < best_dist2:
+            best_dist2 = dist2
+            best_perp = (dr * qz - dz * qr) * math.sqrt(inv_len2[j])
+
+    dist = math.sqrt(best_dist2)
+
+    # a point on the extension of a segment beyond its end is equally close to
+    # the next segment, but has no perpendicular distance to the first one.
+    # Take the sign from the segment with the largest perpendicular distance
+    # among those within tol of the shortest distance
+    if signed and abs(best_perp) <= tol and dist > tol:
+        bound = dist + tol
+        for j in range(len(s1)):
+            dr = d[j, 0]
+            dz = d[j, 1]
+            qr = pr - s1[j, 0]
+            qz = pz - s1[j, 1]
+
+            t = min(max((qr * dr + qz * dz) * inv_len2[j], 0.0), 1.0)
+
+            er = qr - t * dr
+            ez = qz - t * dz
+            if er * er + ez * ez <= bound * bound:
+                perp = (dr * qz - dz * qr) * math.sqrt(inv_len2[j])
+                if abs(perp) > abs(best_perp):
+                    best_perp = perp
+
+    # signed perpendicular distance to the closest segment, positive if inside
+    if signed and best_perp <= -tol:
+        dist = -dist
+
+    return tol if abs(dist) < tol else dist
+
+
+def _point_inside(pr, pz, r, z, bounds, tol):
+    # whether the point (pr, pz) is inside the polygon or within tol of its surface
+
+    # points outside the bounding box (r_min, r_max, z_min, z_max) by more than
+    # tol cannot be inside, skip the loop over the edges
+    if (
+        pr < bounds[0] - tol
+        or pr > bounds[1] + tol
+        or pz < bounds[2] - tol
+        or pz > bounds[3] + tol
+    ):
+        return False
+
+    n_vertices = len(r)
+
+    inside = False
+    min_dist2 = math.inf
+
+    for j in range(n_vertices):
+        k = j + 1 if j + 1 < n_vertices else 0
+        dr = r[k] - r[j]
+        dz = z[k] - z[j]
+
+        # crossing number test with a ray in the positive r direction
+        if ((z[j] > pz) != (z[k] > pz)) and (pr < dr * (pz - z[j]) / dz + r[j]):
+            inside = not inside
+
+        # shortest distance, skipping the closing edge
+        if k > 0:
+            qr = pr - r[j]
+            qz = pz - z[j]
+            len2 = dr * dr + dz * dz
+            t = (qr * dr + qz * dz) / len2 if len2 > 0 else 0.0
+            t = min(max(t, 0.0), 1.0)
+
+            er = qr - t * dr
+            ez = qz - t * dz
+            min_dist2 = min(min_dist2, er * er + ez * ez)
+
+    return inside or min_dist2 <= tol * tol
+
+
+# fast-math flags of the compiled kernels: all of LLVM's except "nnan" and
+# "ninf", since the kernels rely on infinite initial minima (and return them
+# for empty sets of segments)
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+_point_min_dist_cpu = numba.njit(fastmath=_FASTMATH, cache=True)(_point_min_dist)
+_point_inside_cpu = numba.njit(fastmath=_FASTMATH, cache=True)(_point_inside)
+_point_min_dist_gpu = cuda.jit(device=True)(_point_min_dist)
+_point_inside_gpu = cuda.jit(device=True)(_point_inside)
+
+
+@numba.njit(parallel=True, fastmath=_FASTMATH, cache=True)
+def polyline_min_dist(
+    points: NDArray,
+    s1: NDArray,
+    d: NDArray,
+    inv_len2: NDArray,
+    tol: float,
+    signed: bool,
+    out: NDArray,
+) -> None:
+    """Get the shortest distance between each point and a set of line segments.
+
+    Each point is projected onto every segment, with the projection parameter
+    :math:`t` clamped to :math:`[0, 1]`:
+
+    .. math::
+        t = \\mathrm{clip}\\left(\\frac{(p - s_1) \\cdot d}{d \\cdot d}, 0, 1\\right)
+
+    where :math:`d = s_2 - s_1`. The distance is then the modulus of
+    :math:`p - (s_1 + t d)`, minimized over the segments. A sign is attached
+    based on the cross product of the closest segment vector and the vector
+    from :math:`s_1` to the point. To avoid numerical issues any point within
+    the tolerance is considered inside.
+
+    The loop over the segments runs in registers for each point, so no
+    `(n_points,n_segments)` temporary arrays are built, and is parallelized
+    over the points. The segments are described by their first point, their
+    direction vector and inverse squared length, which can be precomputed
+    once with :func:`get_segment_arrays`.
+
+    Parameters
+    ----------
+    points
+        `(n_points,2)` contiguous array of points to compare, first axis
+        corresponds to the point index and the second to `(r,z)`.
+    s1
+        `(n_segments,2)` contiguous array of the first points in the line
+        segment, for the second axis indices `0,1` correspond to `r,z`.
+    d
+        `(n_segments,2)` contiguous array of the segment vectors
+        :math:`s_2 - s_1`.
+    inv_len2
+        `(n_segments,)` array of the inverse squared length of each segment.
+    tol
+        tolerance when computing sign, points within this distance to the
+        surface are pushed inside.
+    signed
+        boolean flag to attach a sign to the distance (positive if inside).
+    out
+        `(n_points,)` output array for the shortest distance of each point.
+    """
+    for i in numba.prange(len(points)):
+        out[i] = _point_min_dist_cpu(
+            points[i, 0], points[i, 1], s1, d, inv_len2, tol, signed
+        )
+
+
+@numba.njit(parallel=True, fastmath=_FASTMATH, cache=True)
+def polyline_inside(
+    points: NDArray, r: NDArray, z: NDArray, tol: float, out: NDArray
+) -> None:
+    """Check whether each point is inside a polygon, or within a tolerance of its surface.
+
+    Based on the crossing number test by W. R. Franklin (`pnpoly`): a ray is
+    cast from each point in the positive `r` direction and the point is
+    inside if it crosses an odd number of edges of the polygon. For each
+    point a single loop over the edges computes the crossing number and the
+    shortest distance to the surface, so no `(n_points,n_segments)`
+    temporary arrays are built. The loop is parallelized over the points.
+
+    Parameters
+    ----------
+    points
+        `(n_points,2)` contiguous array of points to check, first axis
+        corresponds to the point index and the second to `(r,z)`.
+    r
+        contiguous array of radial positions of the polygon vertices.
+    z
+        contiguous array of vertical positions of the polygon vertices. The
+        polygon is closed by the edge from the last to the first vertex,
+        which is not considered a surface.
+    tol
+        distance outside the surface which is considered inside.
+    out
+        `(n_points,)` boolean output array.
+    """
+    bounds = (r.min(), r.max(), z.min(), z.max())
+
+    for i in numba.prange(len(points)):
+        out[i] = _point_inside_cpu(points[i, 0], points[i, 1], r, z, bounds, tol)
+
+
+@cuda.jit
+def polyline_min_dist_cuda(coords, s1, d, inv_len2, tol, signed, out):
+    """CUDA version of :func:`polyline_min_dist`, with one thread per point.
+
+    Takes `(n_points,3)` device arrays of `(x,y,z)` coordinates, which are
+    converted to `(r,z)` by each thread.
+    """
+    i = cuda.grid(1)
+    if i < coords.shape[0]:
+        pr = math.sqrt(coords[i, 0] * coords[i, 0] + coords[i, 1] * coords[i, 1])
+        out[i] = _point_min_dist_gpu(pr, coords[i, 2], s1, d, inv_len2, tol, signed)
+
+
+@cuda.jit
+def polyline_inside_cuda(coords, r, z, bounds, tol, out):
+    """CUDA version of :func:`polyline_inside`, with one thread per point.
+
+    Takes `(n_points,3)` device arrays of `(x,y,z)` coordinates, which are
+    converted to `(r,z)` by each thread, and writes ``0`` or ``1`` to `out`.
+    The polygon bounding box `bounds` is passed as a device array of
+    `(r_min,r_max,z_min,z_max)`, so that it is not recomputed by each thread.
+    """
+    i = cuda.grid(1)
+    if i < coords.shape[0]:
+        pr = math.sqrt(coords[i, 0] * coords[i, 0] + coords[i, 1] * coords[i, 1])
+        out[i] = 1 if _point_inside_gpu(pr, coords[i, 2], r, z, bounds, tol) else 0
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
 from pint import get_application_registry
 from pyg4ometry import geant4
 
@@ -58,88 +59,80 @@ class V02160A(HPGe):
     def _decode_polycone_coord(self) -> tuple[list[float], list[float]]:
         c = self.metadata.geometry
 
-        def _tan(a):
-            return math.tan(math.pi * a / 180)
+        # tangents of the taper angles
+        tan_bottom, tan_top, tan_borehole = np.tan(
+            np.deg2rad(
+                [
+                    c.taper.bottom.angle_in_deg,
+                    c.taper.top.angle_in_deg,
+                    c.taper.borehole.angle_in_deg,
+                ]
+            )
+        ).tolist()
 
-        r = []
-        z = []
-        surfaces = []
-
-        r_p, z_p, surface_p = make_pplus(c)
-        r += r_p
-        z += z_p
-        surfaces += surface_p
+        r, z, surfaces = make_pplus(c)
 
         if c.taper.bottom.height_in_mm > 0:
-            r += [
-                c.radius_in_mm
-                - c.taper.bottom.height_in_mm * _tan(c.taper.bottom.angle_in_deg),
-                c.radius_in_mm,
-            ]
-
-            z += [
-                0,
-                c.taper.bottom.height_in_mm,
-            ]
-
-            surfaces += ["nplus", "nplus"]
+            r.extend(
+                (
+                    c.radius_in_mm - c.taper.bottom.height_in_mm * tan_bottom,
+                    c.radius_in_mm,
+                )
+            )
+
+            z.extend((0, c.taper.bottom.height_in_mm))
+
+            surfaces.extend(("nplus", "nplus"))
         else:
-            r += [c.radius_in_mm]
-            z += [0]
-            surfaces += ["nplus"]
+            r.append(c.radius_in_mm)
+            z.append(0)
+            surfaces.append("nplus")
 
         if c.taper.top.height_in_mm > 0:
-            r += [
-                c.radius_in_mm,
-                c.radius_in_mm
-                - c.taper.top.height_in_mm * _tan(c.taper.top.angle_in_deg),
-            ]
-
-            z += [
-                c.height_in_mm - c.taper.top.height_in_mm,
-                c.height_in_mm,
-            ]
-            surfaces += ["nplus", "nplus"]
+            r.extend(
+                (c.radius_in_mm, c.radius_in_mm - c.taper.top.height_in_mm * tan_top)
+            )
+
+            z.extend((c.height_in_mm - c.taper.top.height_in_mm, c.height_in_mm))
+            surfaces.extend(("nplus", "nplus"))
 
         else:
-            r += [c.radius_in_mm]
-            z += [c.height_in_mm]
-            surfaces += ["nplus"]
+            r.append(c.radius_in_mm)
+            z.append(c.height_in_mm)
+            surfaces.append("nplus")
 
         if c.taper.borehole.height_in_mm > 0:
-            r += [
-                c.borehole.radius_in_mm
-                + c.taper.borehole.height_in_mm * _tan(c.taper.borehole.angle_in_deg),
-                c.borehole.radius_in_mm,
-            ]
-
-            z += [
-                c.height_in_mm,
-                c.height_in_mm - c.taper.borehole.height_in_mm,
-            ]
-            surfaces += ["nplus", "nplus"]
+            r.extend(
+                (
+                    c.borehole.radius_in_mm
+                    + c.taper.borehole.height_in_mm * tan_borehole,
+                    c.borehole.radius_in_mm,
+                )
+            )
+
+            z.extend((c.height_in_mm, c.height_in_mm - c.taper.borehole.height_in_mm))
+            surfaces.extend(("nplus", "nplus"))
         else:
-            r += [c.borehole.radius_in_mm]
-            z += [c.height_in_mm]
-            surfaces += ["nplus"]
+            r.append(c.borehole.radius_in_mm)
+            z.append(c.height_in_mm)
+            surfaces.append("nplus")
 
         if c.taper.borehole.height_in_mm != c.borehole.depth_in_mm:
-            r += [
-                c.borehole.radius_in_mm,
-                0,
-            ]
-
-            z += [
-                c.height_in_mm - c.borehole.depth_in_mm,
-                c.height_in_mm - c.borehole.depth_in_mm,
-            ]
-            surfaces += ["nplus", "nplus"]
+            r.extend((c.borehole.radius_in_mm, 0))
+
+            z.extend(
+                (
+                    c.height_in_mm - c.borehole.depth_in_mm,
+                    c.height_in_mm - c.borehole.depth_in_mm,
+                )
+            )
+            surfaces.extend(("nplus", "nplus"))
         else:
-            r += [0]
+            r.append(0)
 
-            z += [c.height_in_mm - c.borehole.depth_in_mm]
+            z.append(c.height_in_mm - c.borehole.depth_in_mm)
 
-            surfaces += ["nplus"]
+            surfaces.append("nplus")
 
         self.surfaces = surfaces
 
@@ -150,17 +143,7 @@ class V02160A(HPGe):
         c = self.metadata.geometry
 
         # volume of the full solid without cut
-        full_volume = 0
-        pr, pz = self._decode_polycone_coord()
-        r1 = pr[-1]
-        z1 = pz[-1]
-        for i in range(len(pz)):
-            r2 = pr[i]
-            z2 = pz[i]
-            full_volume += (r1 * r1 + r1 * r2 + r2 * r2) * (z2 - z1)
-            r1 = r2
-            z1 = z2
-        full_volume = 2 * math.pi * abs(full_volume) / 6
+        full_volume = self._polycone_volume()
 
         # calculate the volume of the cut
         r = c.radius_in_mm
@@ -26,3 +26,40 @@ def test_surface_area(test_data_configs):
 
     assert len(gedet.surface_area(surface_indices=[])) == 0
     assert np.sum(gedet.surface_area(surface_indices=None)) > 0
+
+
+def test_cached_profile():
+    reg = geant4.Registry()
+    gedet = make_hpge(configs.V02162B, registry=reg)
+
+    r, z = gedet.get_profile()
+    assert np.array_equal(gedet._r, r)
+    assert np.array_equal(gedet._z, z)
+    assert gedet._r.dtype == np.float64
+
+
+def test_surface_area_values():
+    reg = geant4.Registry()
+    gedet = make_hpge(configs.V02162B, registry=reg)
+
+    # p+ contact disk and bottom annulus outside the groove
+    area = gedet.surface_area(surface_indices=[0, 4]).to("mm^2").m
+    assert np.allclose(area, [np.pi * 10**2, np.pi * (50**2 - 15**2)])
+
+    # top taper is a frustum
+    r1, r2 = gedet._r[6:8]
+    dz = gedet._z[7] - gedet._z[6]
+    area = gedet.surface_area(surface_indices=[6]).to("mm^2").m
+    assert np.allclose(area, np.pi * (r1 + r2) * np.hypot(r2 - r1, dz))
+
+
+def test_volume():
+    reg = geant4.Registry()
+    gedet = make_hpge(configs.V02162B, registry=reg)
+
+    # sum of the volume of the cylinders and frustums of the profile
+    r, z = gedet._r, gedet._z
+    expected = np.sum(
+        np.pi / 3 * (r[1:] ** 2 + r[1:] * r[:-1] + r[:-1] ** 2) * np.diff(z)
+    )
+    assert gedet.volume.to("mm^3").m == pytest.approx(abs(expected))
@@ -6,6 +6,7 @@ import numpy as np
 import pytest
 from dbetto import TextDB
 from legendtestdata import LegendTestData
+from numba import cuda
 from pyg4ometry import geant4
 
 from legendhpges import make_hpge
@@ -195,3 +196,115 @@ def test_is_in_borehole(test_data_configs):
     )  # outside
 
     assert np.all(is_in == [False, True, False])
+
+
+def test_sign_matches_inside(reg):
+    dets = [make_hpge(configs[name], registry=reg) for name in ("V02162B", "V07646A")]
+
+    for gedet in dets:
+        # grid in the (r, z) plane, around the detector
+        r, z = gedet.get_profile()
+        rr, zz = np.meshgrid(
+            np.arange(0, max(r) + 5), np.arange(min(z) - 5, max(z) + 5)
+        )
+        coords = np.column_stack((rr.ravel(), np.zeros(rr.size), zz.ravel()))
+
+        dist = gedet.distance_to_surface(coords, signed=True)
+        assert np.all((dist > 0) == gedet.is_inside(coords))
+
+    # on the extension of the bottom surface, beyond the outer corner
+    assert dets[0].distance_to_surface([[60, 0, 0]], signed=True) == pytest.approx(-10)
+
+
+def test_precision(reg):
+    gedet = make_hpge(configs.V02162B, registry=reg)
+    gedet_32 = make_hpge(
+        configs.V02162B, registry=reg, name="V02162B_32", precision="float32"
+    )
+
+    coords = np.random.default_rng(0).uniform(-60, 100, size=(100, 3))
+    dist = gedet.distance_to_surface(coords, signed=True)
+    dist_32 = gedet_32.distance_to_surface(coords, signed=True)
+
+    assert dist_32.dtype == np.float32
+    assert np.allclose(dist, dist_32, atol=1e-4)
+
+    # volume and surface area are always computed in double precision
+    assert gedet_32.volume.m == gedet.volume.m
+    assert np.array_equal(gedet_32.surface_area().m, gedet.surface_area().m)
+
+    # points on the surface are still inside with the default tolerance:
+    # vertices and segment midpoints of the profile, at 0 and 45 deg
+    r, z = (np.asarray(a, dtype=float) for a in gedet.get_profile())
+    r_s = np.concatenate((r, (r[1:] + r[:-1]) / 2))
+    z_s = np.concatenate((z, (z[1:] + z[:-1]) / 2))
+    on_surface = np.vstack(
+        (
+            np.column_stack((r_s, np.zeros_like(r_s), z_s)),
+            np.column_stack((r_s / np.sqrt(2), r_s / np.sqrt(2), z_s)),
+        )
+    )
+    assert np.all(gedet_32.is_inside(on_surface))
+    assert np.all(gedet_32.distance_to_surface(on_surface, signed=True) > 0)
+
+    with pytest.raises(ValueError):
+        make_hpge(configs.V02162B, registry=reg, name="bad", precision="float16")
+
+
+def test_coords_input(reg):
+    gedet = make_hpge(configs.V02162B, registry=reg)
+
+    coords = np.random.default_rng(0).uniform(-60, 100, size=(100, 6))
+    view = coords[:, ::2]
+    dist = gedet.distance_to_surface(np.array(view), signed=True)
+
+    # strided views, lists and integer coordinates are accepted
+    assert np.array_equal(gedet.distance_to_surface(view, signed=True), dist)
+    assert np.array_equal(gedet.distance_to_surface(view.tolist(), signed=True), dist)
+    assert np.array_equal(
+        gedet.is_inside(view.astype(int)), gedet.is_inside(view.astype(int) * 1.0)
+    )
+
+    with pytest.raises(ValueError):
+        gedet.is_inside(np.zeros(3))
+
+
+def test_distance_batch(reg):
+    dets = [
+        make_hpge(configs.V02162B, registry=reg),
+        make_hpge(configs.V07646A, registry=reg),
+        make_hpge(
+            configs.V02162B, registry=reg, name="V02162B_32", precision="float32"
+        ),
+    ]
+    coords = np.random.default_rng(0).uniform(-60, 100, size=(100, 3))
+
+    dists = dets[0].distance_to_surface_batch(coords, dets, signed=True)
+    assert dists.shape == (100, 3)
+    for k, det in enumerate(dets):
+        assert np.allclose(dists[:, k], det.distance_to_surface(coords, signed=True))
+
+    with pytest.raises(NotImplementedError):
+        dets[0].distance_to_surface_batch(
+            coords, [*dets, make_hpge(configs.P00664B, registry=reg)]
+        )
+
+
+@pytest.mark.skipif(not cuda.is_available(), reason="CUDA is not available")
+def test_gpu(reg):
+    gedet = make_hpge(configs.V02162B, registry=reg)
+    coords = np.random.default_rng(0).uniform(-60, 100, size=(100, 3))
+
+    dists = gedet.distance_to_surface_gpu(coords, signed=True).copy_to_host()
+    assert np.allclose(dists, gedet.distance_to_surface(coords, signed=True))
+
+    dists = gedet.distance_to_surface_gpu(
+        cuda.to_device(coords), surface_indices=[0, 3]
+    ).copy_to_host()
+    assert np.allclose(dists, gedet.distance_to_surface(coords, surface_indices=[0, 3]))
+
+    is_in = gedet.is_inside_gpu(coords).copy_to_host()
+    assert np.all(is_in.astype(bool) == gedet.is_inside(coords))
+
+    with pytest.raises(ValueError):
+        gedet.distance_to_surface_gpu([[1, 0, 0, 0]])
@@ -20,6 +20,11 @@ def test_enriched_ge_density():
         5.422, rel=1e-3
     )
 
+    # the density is computed once for each enrichment
+    assert materials.enriched_germanium_density(
+        0.92
+    ) is materials.enriched_germanium_density(0.92)
+
 
 def test_g4_materials():
     assert (
@@ -89,6 +89,94 @@ def test_distances():
     )
 
 
+def _min_dist_reference(s1, s2, points):
+    # unsigned distance to each segment with broadcasting, minimized over the segments
+    d = s2 - s1
+    p = points[:, np.newaxis, :] - s1[np.newaxis, :, :]
+    t = np.clip(np.sum(p * d, axis=-1) / np.sum(d * d, axis=-1), 0, 1)
+    return np.min(np.linalg.norm(p - t[..., np.newaxis] * d, axis=-1), axis=1)
+
+
+def test_distance_to_segments():
+    # counter-clockwise polyline of a square with side 2, open on the r=0 axis
+    r = np.array([0, 2, 2, 0])
+    z = np.array([0, 0, 2, 2])
+    segments = utils.get_segment_arrays(r, z)
+
+    # first inside close to the side
+    # second inside in the center
+    # third outside next to the side
+    # fourth outside beyond the corner (distance is 5)
+    # fifth exactly on the surface
+    # last on the extensions of an edge beyond a corner
+    points = np.array(
+        [[1.5, 1], [1, 1], [3, 1], [5, 6], [2, 1], [3, 0], [2, 3]], dtype=float
+    )
+    res = np.array([0.5, 1, -1, -5, 1e-11, -1, -1])
+
+    for signed in (True, False):
+        out = np.empty(len(points))
+        utils.polyline_min_dist(points, *segments, 1e-11, signed, out)
+        assert np.allclose(out, res if signed else np.abs(res))
+
+    # must agree with the per segment computations
+    s1, s2 = utils.get_line_segments(r, z)
+    points = np.random.default_rng(0).uniform(-1, 3, size=(50, 2))
+    dists = utils.shortest_distance(s1, s2, points, signed=False)
+
+    out = np.empty(len(points))
+    utils.polyline_min_dist(points, *segments, 1e-11, False, out)
+    assert np.allclose(out, np.min(dists, axis=1))
+    assert np.allclose(out, _min_dist_reference(s1, s2, points))
+
+    # no segments, the distance is infinite
+    utils.polyline_min_dist(
+        points, np.empty((0, 2)), np.empty((0, 2)), np.empty(0), 1e-11, True, out
+    )
+    assert np.all(np.isinf(out))
+
+
+def _inside_reference(points, r, z):
+    # crossing number test for all point-edge pairs with broadcasting
+    r1, z1 = r.astype(float), z.astype(float)
+    r2, z2 = np.roll(r1, -1), np.roll(z1, -1)
+    pr, pz = points[:, 0, np.newaxis], points[:, 1, np.newaxis]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_cross = (r2 - r1) * (pz - z1) / (z2 - z1) + r1
+    crosses = ((z1 > pz) != (z2 > pz)) & (pr < r_cross)
+    return np.bitwise_xor.reduce(crosses, axis=1)
+
+
+def test_is_inside_polygon():
+    # L-shaped profile, closed along the r=0 axis
+    r = np.array([0, 2, 2, 1, 1, 0], dtype=float)
+    z = np.array([0, 0, 1, 1, 2, 2], dtype=float)
+
+    # inside the bottom, inside the top, in the notch, above, beside, on the axis
+    # and within tol or further outside the surface
+    points = np.array(
+        [
+            [1.5, 0.5],
+            [0.5, 1.5],
+            [1.5, 1.5],
+            [0.5, 3],
+            [3, 0.5],
+            [0, 1],
+            [2 + 1e-12, 0.5],
+            [2 + 1e-3, 0.5],
+        ]
+    )
+    out = np.empty(len(points), dtype=np.bool_)
+    utils.polyline_inside(points, r, z, 1e-11, out)
+    assert np.all(out == np.array([True, True, False, False, False, True, True, False]))
+
+    # must agree with the broadcasted crossing number test
+    points = np.random.default_rng(0).uniform(-0.5, 2.5, size=(200, 2))
+    out = np.empty(len(points), dtype=np.bool_)
+    utils.polyline_inside(points, r, z, 1e-11, out)
+    assert np.all(out == _inside_reference(points, r, z))
+
+
 def test_plane_distance_unconstrained():
     # start with a plane on the x,y plane
     a = np.array([0, 0, 1])
@@ -156,3 +244,17 @@ def test_plane_distance_constrained():
         np.array([np.nan, 1, np.nan, 0.1]),
         equal_nan=True,
     )
+
+
+def test_load_dict(tmp_path):
+    content = {"name": "V00000A", "geometry": {"height_in_mm": 10}, "list": [1, 2]}
+
+    (tmp_path / "det.json").write_text(
+        '{"name": "V00000A", "geometry": {"height_in_mm": 10}, "list": [1, 2]}'
+    )
+    (tmp_path / "det.yaml").write_text(
+        "name: V00000A\ngeometry:\n  height_in_mm: 10\nlist: [1, 2]\n"
+    )
+
+    assert utils.load_dict(tmp_path / "det.json") == content
+    assert utils.load_dict(tmp_path / "det.yaml") == content